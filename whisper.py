@@ -1,21 +1,118 @@
 import asyncio
+import collections
+import hashlib
 import os
+import random
+import re
+import shutil
 import sys
+import tempfile
+import uuid
 
 import aiofiles
+import httpx
+import orjson
 
-from datetime import datetime
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import AsyncGenerator, Dict, Iterable, List, Optional, Tuple
 
+from aiolimiter import AsyncLimiter
 from dotenv import load_dotenv
-from openai import OpenAI
-from openai.types.audio.transcription_segment import TranscriptionSegment
-from openai.types.audio.transcription_verbose import TranscriptionVerbose
-from pydub import AudioSegment
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+    RateLimitError,
+)
 
 
-# 10 minutes in milliseconds (should ensure resulting file <25 MB, adjust as needed)
-CHUNK_DURATION_MS = 10 * 60 * 1000
+# 10 minutes in seconds (should ensure resulting file <25 MB, adjust as needed)
+CHUNK_DURATION_S = 10 * 60
+
+# Chunk boundaries are moved into the nearest silence within this many
+# seconds of the target boundary, so words are not cut in half
+SILENCE_SEARCH_WINDOW_S = 15
+SILENCE_THRESHOLD_DB = -35
+SILENCE_MIN_DURATION_S = 0.3
+
+# Formats accepted by Whisper that ffmpeg can split without re-encoding.
+# Anything else is converted to 16 kHz mono PCM WAV while splitting, which
+# needs no encoder work and keeps a 10-minute chunk around 19 MB.
+STREAM_COPY_FORMATS = {"flac", "m4a", "mp3", "mp4", "ogg", "wav", "webm"}
+TRANSCODE_FORMAT = "wav"
+TRANSCODE_CODEC_ARGS = ["-c:a", "pcm_s16le", "-ar", "16000", "-ac", "1"]
+
+# Bitrate of the converted audio (16 kHz * 16 bit * 1 channel). Sources above
+# it (e.g. 44.1 kHz stereo WAV, FLAC) are downsampled too, as Whisper resamples
+# to 16 kHz mono anyway and the extra bytes only slow down uploads.
+TRANSCODE_BITRATE_KBPS = 256
+
+WHISPER_MODEL = "whisper-1"
+
+# Transcriptions are cached by chunk content so re-runs skip the API entirely
+CACHE_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+    "whisper-audio-transcriber",
+)
+
+# Least recently used entries are pruned once the cache holds more than this
+MAX_CACHE_ENTRIES = 1000
+
+# Number of trailing ffmpeg log lines kept for error messages
+FFMPEG_ERROR_TAIL_LINES = 20
+
+# Maximum number of chunks being transcribed by the API at the same time
+MAX_CONCURRENT_TRANSCRIPTIONS = int(os.getenv("WHISPER_CONCURRENCY", "8"))
+
+# Number of split chunks allowed to wait for a free transcription worker
+CHUNK_QUEUE_SIZE = 4
+
+# Whisper requests-per-minute quota, enforced client-side with a token bucket
+REQUESTS_PER_MINUTE = int(os.getenv("WHISPER_RPM", "50"))
+
+# Retry policy for transient API failures (rate limits, 5xx, dropped connections)
+MAX_TRANSCRIPTION_ATTEMPTS = 5
+RETRY_BASE_DELAY_S = 1.0
+RETRY_MAX_DELAY_S = 60.0
+RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Connection pool shared by all concurrent chunk uploads
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+@dataclass
+class Segment:
+    """A transcribed segment, with start and end offsets in seconds."""
+
+    __slots__ = ("start", "end", "text")
+    start: float
+    end: float
+    text: str
+
+
+@dataclass
+class Transcription:
+    """The parts of a verbose_json Whisper response this script uses."""
+
+    __slots__ = ("text", "segments")
+    text: str
+    segments: List[Segment]
+
+
+def parse_transcription(data: bytes) -> Transcription:
+    """
+    Parses a raw verbose_json Whisper response with orjson, keeping only
+    the text and segment timestamps instead of building the full pydantic
+    TranscriptionVerbose model for every segment.
+    """
+    payload = orjson.loads(data)
+    segments = [
+        Segment(segment["start"], segment["end"], segment["text"])
+        for segment in payload.get("segments") or []
+    ]
+    return Transcription(payload.get("text") or "", segments)
 
 
 def parse_arguments() -> Tuple[str, str]:
@@ -41,164 +138,619 @@ def parse_arguments() -> Tuple[str, str]:
     return audio_file_path, language_code
 
 
-async def load_environment_variables() -> None:
-    """Loads environment variables from a .env file."""
-    await asyncio.to_thread(load_dotenv)
-
-
-async def get_openai_client() -> OpenAI:
-    """Initializes and returns the OpenAI client."""
+def get_openai_client() -> AsyncOpenAI:
+    """Initializes and returns the async OpenAI client."""
     openai_api_key = os.getenv("OPENAI_API_KEY")
     if not openai_api_key:
         raise ValueError("OPENAI_API_KEY not found in environment variables.")
-    return OpenAI(api_key=openai_api_key)
+    # Retries are handled by transcribe_chunk, so the client's own are disabled
+    return AsyncOpenAI(
+        api_key=openai_api_key,
+        max_retries=0,
+        http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS),
+    )
 
 
-async def read_audio_file(audio_file_path: str) -> AudioSegment:
+def parse_timestamp(timestamp: str) -> float:
     """
-    Reads an audio file using pydub in a thread
-    to avoid blocking the event loop.
+    Converts an ffmpeg HH:MM:SS.ss timestamp into seconds.
     """
-    return await asyncio.to_thread(AudioSegment.from_file, audio_file_path)
+    hours, minutes, seconds = timestamp.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
 
 
-def split_audio_into_chunks(audio: AudioSegment) -> List[AudioSegment]:
+async def analyze_audio(
+    audio_file_path: str,
+) -> Tuple[float, Optional[int], List[Tuple[float, float]]]:
+    """
+    Runs ffmpeg's silencedetect filter over the audio file.
+    Returns the audio duration, the audio bitrate in kb/s (None if unknown)
+    and a list of (start, end) silences in seconds.
+    """
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-nostdin",
+        "-i", audio_file_path,
+        "-vn",
+        "-af", f"silencedetect=noise={SILENCE_THRESHOLD_DB}dB:d={SILENCE_MIN_DURATION_S}",
+        "-f", "null",
+        "-",
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    _, stderr = await process.communicate()
+    log = stderr.decode(errors="replace")
+    if process.returncode != 0:
+        raise RuntimeError(f"ffmpeg failed to analyze '{audio_file_path}': {log.strip()}")
+
+    # Prefer the container duration, falling back to the last decoded timestamp
+    duration_match = re.search(r"Duration: (\d+:\d+:\d+(?:\.\d+)?)", log)
+    time_matches = re.findall(r"time=(\d+:\d+:\d+(?:\.\d+)?)", log)
+    if duration_match:
+        duration = parse_timestamp(duration_match.group(1))
+    elif time_matches:
+        duration = parse_timestamp(time_matches[-1])
+    else:
+        raise RuntimeError(f"Could not determine the duration of '{audio_file_path}'")
+
+    # Prefer the audio stream bitrate (the container one includes any video),
+    # falling back to the container bitrate for codecs that do not report one
+    audio_stream = re.search(r"Stream #[^\n]*: Audio: ([^\n]*)", log)
+    stream_match = audio_stream and re.search(r"(\d+) kb/s", audio_stream.group(1))
+    container_match = re.search(r"Duration: [^\n]*bitrate: (\d+) kb/s", log)
+    bitrate_match = stream_match or container_match
+    bitrate_kbps = int(bitrate_match.group(1)) if bitrate_match else None
+
+    silences: List[Tuple[float, float]] = []
+    silence_start: Optional[float] = None
+    for match in re.finditer(r"silence_(start|end): (-?\d+(?:\.\d+)?)", log):
+        if match.group(1) == "start":
+            silence_start = max(0.0, float(match.group(2)))
+        elif silence_start is not None:
+            silences.append((silence_start, float(match.group(2))))
+            silence_start = None
+    if silence_start is not None:
+        silences.append((silence_start, duration))
+
+    return duration, bitrate_kbps, silences
+
+
+def choose_split_points(
+    duration: float,
+    silences: List[Tuple[float, float]],
+    target_seconds: float,
+    window_seconds: float,
+) -> List[float]:
+    """
+    Picks chunk boundaries roughly every target_seconds, snapping each one
+    to the middle of the closest silence within window_seconds of it.
+    Falls back to the exact target boundary when no silence is nearby.
+    A tail of window_seconds or less is merged into the previous chunk
+    rather than split off, as Whisper rejects very short audio and tends
+    to hallucinate text for short silent clips.
+    """
+    split_points: List[float] = []
+    boundary = target_seconds
+    while duration - boundary > window_seconds:
+        window_start = boundary - window_seconds
+        window_end = min(boundary + window_seconds, duration - window_seconds)
+        candidates = [
+            (max(start, window_start) + min(end, window_end)) / 2
+            for start, end in silences
+            if start < window_end and end > window_start
+        ]
+        split_point = min(candidates, key=lambda point: abs(point - boundary), default=boundary)
+        split_points.append(split_point)
+        boundary = split_point + target_seconds
+    return split_points
+
+
+async def read_tail(stream: asyncio.StreamReader, max_lines: int) -> List[str]:
     """
-    Splits the AudioSegment into multiple smaller chunks
-    based on the global CHUNK_DURATION_MS setting.
+    Reads a stream to EOF, keeping only its last max_lines lines.
     """
-    return audio[::CHUNK_DURATION_MS]
+    tail: "collections.deque[str]" = collections.deque(maxlen=max_lines)
+    async for line in stream:
+        tail.append(line.decode(errors="replace").rstrip())
+    return list(tail)
+
+
+async def segment_audio(
+    audio_file_path: str,
+    split_points: List[float],
+    output_pattern: str,
+    transcode: bool,
+) -> AsyncGenerator[str, None]:
+    """
+    Splits the audio file at the given split points (in seconds) with a single
+    ffmpeg pass, writing the chunks to output_pattern (which must contain "%d").
+    Audio is stream-copied, so nothing is decoded or re-encoded, unless
+    transcode is set, in which case it is converted to 16 kHz mono PCM WAV
+    once while splitting.
+    Yields each chunk file path as soon as ffmpeg has finished writing it.
+    """
+    codec_args = TRANSCODE_CODEC_ARGS if transcode else ["-c", "copy"]
+    if split_points:
+        split_args = ["-segment_times", ",".join(f"{point:.3f}" for point in split_points)]
+    else:
+        # Audio fits in one chunk (which may run slightly past CHUNK_DURATION_S);
+        # ffmpeg rejects an empty list of times, so use a length no input reaches
+        split_args = ["-segment_time", str(10**9)]
+
+    # ffmpeg reports every completed segment on stdout via the segment list
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-nostdin",
+        "-y",
+        "-loglevel", "error",
+        "-i", audio_file_path,
+        "-vn",
+        *codec_args,
+        "-f", "segment",
+        *split_args,
+        "-segment_start_number", "1",
+        "-segment_list", "pipe:1",
+        "-segment_list_type", "flat",
+        "-reset_timestamps", "1",
+        output_pattern,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    # stderr is drained concurrently, otherwise a chatty decoder could fill
+    # the pipe and block ffmpeg before it closes stdout
+    stderr_task = asyncio.create_task(read_tail(process.stderr, FFMPEG_ERROR_TAIL_LINES))
+    output_dir = os.path.dirname(output_pattern)
+    try:
+        async for line in process.stdout:
+            chunk_name = line.decode().strip()
+            if chunk_name:
+                yield os.path.join(output_dir, chunk_name)
+        await process.wait()
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+        stderr_tail = await stderr_task
+
+    if process.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg failed to split '{audio_file_path}': " + "\n".join(stderr_tail)
+        )
 
 
-async def export_chunk(
-    audio_chunk: AudioSegment, output_path: str, audio_format: str
-) -> None:
+def get_retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Returns how long to wait before retrying a failed API call.
+    Honors the server's Retry-After header when present, otherwise uses
+    exponential backoff with random jitter.
     """
-    Exports a single audio chunk to a file in the specified format
-    (done in a thread to avoid blocking the event loop).
+    retry_after: Optional[str] = None
+    if isinstance(error, APIStatusError):
+        retry_after = error.response.headers.get("retry-after")
+    if retry_after:
+        try:
+            return min(RETRY_MAX_DELAY_S, float(retry_after))
+        except ValueError:
+            pass
+    return min(RETRY_MAX_DELAY_S, RETRY_BASE_DELAY_S * 2**attempt + random.random())
+
+
+async def read_chunk_file(chunk_file_path: str) -> bytes:
     """
-    await asyncio.to_thread(audio_chunk.export, output_path, format=audio_format)
+    Reads an exported audio chunk asynchronously using aiofiles.
+    """
+    async with aiofiles.open(chunk_file_path, "rb") as file:
+        return await file.read()
 
 
 async def transcribe_chunk(
-    client: OpenAI, chunk_file_path: str, language: str
-) -> TranscriptionVerbose:
+    client: AsyncOpenAI,
+    chunk_name: str,
+    chunk_data: bytes,
+    audio_format: str,
+    language: str,
+    limiter: AsyncLimiter,
+) -> bytes:
     """
     Calls OpenAI's Whisper API to transcribe a single audio chunk.
-    Performed in a thread because the OpenAI client is synchronous.
-    Ensures the file is opened with the correct extension so
-    that the format is recognized.
+    The chunk is uploaded with the correct filename and content type
+    so that the format is recognized.
+    Every attempt, including retries, waits for a limiter slot first.
+    Transient failures are retried with exponential backoff.
+    Returns the raw verbose_json response body, see parse_transcription.
     """
-
-    def _sync_transcribe() -> dict:
-        # Opening the file synchronously
-        with open(chunk_file_path, "rb") as file:
-            return client.audio.transcriptions.create(
-                file=file,
-                model="whisper-1",
+    for attempt in range(MAX_TRANSCRIPTION_ATTEMPTS):
+        await limiter.acquire()
+        try:
+            response = await client.audio.transcriptions.with_raw_response.create(
+                file=(chunk_name, chunk_data, f"audio/{audio_format}"),
+                model=WHISPER_MODEL,
                 response_format="verbose_json",
                 timestamp_granularities=["segment"],
                 language=language,
             )
+            return response.content
+        except RETRYABLE_ERRORS as error:
+            if attempt == MAX_TRANSCRIPTION_ATTEMPTS - 1:
+                raise
+            delay = get_retry_delay(error, attempt)
+            print(
+                f"Transcribing {chunk_name} failed ({type(error).__name__}), "
+                f"retrying in {delay:.1f} seconds"
+            )
+            await asyncio.sleep(delay)
+
 
-    return await asyncio.to_thread(_sync_transcribe)
+async def get_cache_path(chunk_data: bytes, language: str) -> str:
+    """
+    Returns the cache file path for a chunk, keyed by a hash of its
+    content together with the language and model used to transcribe it.
+    Hashing runs in a thread; hashlib releases the GIL for large inputs,
+    so several chunks are hashed in parallel without blocking the event loop.
+    """
+    digest = (await asyncio.to_thread(hashlib.sha256, chunk_data)).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}-{language}-{WHISPER_MODEL}.json")
 
 
-async def save_file(content: str, file_path: str) -> None:
+async def load_cached_transcription(cache_path: str) -> Optional[Transcription]:
+    """
+    Loads a cached transcription, returning None if it is missing or unreadable.
+    """
+    try:
+        async with aiofiles.open(cache_path, "rb") as file:
+            transcription = parse_transcription(await file.read())
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    try:
+        # Mark the entry as recently used, so pruning keeps it
+        await asyncio.to_thread(os.utime, cache_path)
+    except OSError:
+        pass
+    return transcription
+
+
+def prune_cache() -> None:
+    """
+    Deletes the least recently used cache entries, by modification time,
+    so that at most MAX_CACHE_ENTRIES remain.
+    """
+    entries = []
+    with os.scandir(CACHE_DIR) as scan:
+        for entry in scan:
+            if not entry.name.endswith(".json"):
+                continue
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except OSError:
+                pass
+    if len(entries) <= MAX_CACHE_ENTRIES:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - MAX_CACHE_ENTRIES]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+async def save_cached_transcription(response_data: bytes, cache_path: str) -> None:
+    """
+    Stores a raw verbose_json API response in the cache. The entry is
+    written to a temporary file and moved into place, so an interrupted
+    write never leaves a truncated entry. The cache is only an
+    optimization, so failures are reported and otherwise ignored.
+    Least recently used entries are pruned after each write.
     """
-    Saves content to a file asynchronously using aiofiles.
+    temp_path = f"{cache_path}.{uuid.uuid4().hex}.tmp"
+    try:
+        async with aiofiles.open(temp_path, "wb") as file:
+            await file.write(response_data)
+        await asyncio.to_thread(os.replace, temp_path, cache_path)
+        await asyncio.to_thread(prune_cache)
+    except OSError as error:
+        print(f"Could not write cache entry {cache_path}: {error}")
+        try:
+            await asyncio.to_thread(os.unlink, temp_path)
+        except OSError:
+            pass
+
+
+async def save_file(lines: Iterable[str], file_path: str, mode: str = "w") -> None:
     """
-    async with aiofiles.open(file_path, "w") as file:
-        await file.write(content)
+    Streams lines to a file in a worker thread, so the full content
+    never has to be built as one string in memory.
+    Pass mode="a" to append to an existing file.
+    """
+
+    def _write_lines() -> None:
+        with open(file_path, mode, encoding="utf-8") as file:
+            file.writelines(lines)
+
+    await asyncio.to_thread(_write_lines)
+
+
+def format_timestamp(seconds: float) -> str:
+    """
+    Formats an offset in seconds as HH:MM:SS using integer arithmetic.
+    """
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, whole_seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{whole_seconds:02d}"
 
 
-def format_segment_text(segment: TranscriptionSegment) -> str:
+def format_segment_text(segment: Segment, offset: float = 0.0) -> str:
     """
     Formats a transcription segment (with timestamps) into a user-readable string.
+    The offset is the start of the segment's chunk within the full audio, as
+    Whisper reports timestamps relative to the uploaded chunk.
     """
-    start_time = datetime.fromtimestamp(segment.start).strftime("%H:%M:%S")
-    end_time = datetime.fromtimestamp(segment.end).strftime("%H:%M:%S")
+    start_time = format_timestamp(segment.start + offset)
+    end_time = format_timestamp(segment.end + offset)
     return f"{start_time} - {end_time}:\n{segment.text}\n\n"
 
 
 async def process_chunk(
-    client: OpenAI,
-    audio_chunk: AudioSegment,
-    audio_format: str,
+    client: AsyncOpenAI,
+    chunk_file_path: str,
+    chunk_format: str,
     chunk_index: int,
-    audio_name: str,
-    language: str
-) -> TranscriptionVerbose:
+    language: str,
+    limiter: AsyncLimiter,
+) -> Transcription:
     """
-    Exports the chunk to disk, then transcribes it via the OpenAI Whisper API.
-    Returns the transcription result as a TranscriptionVerbose object.
+    Transcribes an exported chunk via the OpenAI Whisper API, unless an
+    identical chunk has already been transcribed and cached.
+    The chunk is read before waiting on the rate limiter, so disk reads
+    overlap with rate limiting instead of delaying the upload.
+    The chunk file is deleted once it has been transcribed.
+    Returns the parsed transcription result.
     """
-    chunk_file_path = f"{audio_name}_{chunk_index}.{audio_format}"
-    print(f"Processing chunk {chunk_index}. Duration: {audio_chunk.duration_seconds} seconds")
-
-    # Export chunk
-    await export_chunk(audio_chunk, chunk_file_path, audio_format)
-
-    # Transcribe chunk
-    transcription_data = await transcribe_chunk(client, chunk_file_path, language)
-    return transcription_data
-
-
-async def run_transcription(audio_file_path: str, language: str) -> None:
+    print(f"Processing chunk {chunk_index}")
+
+    try:
+        chunk_data = await read_chunk_file(chunk_file_path)
+
+        cache_path = await get_cache_path(chunk_data, language)
+        cached = await load_cached_transcription(cache_path)
+        if cached is not None:
+            print(f"Chunk {chunk_index} loaded from cache")
+            return cached
+
+        response_data = await transcribe_chunk(
+            client,
+            os.path.basename(chunk_file_path),
+            chunk_data,
+            chunk_format,
+            language,
+            limiter,
+        )
+        await save_cached_transcription(response_data, cache_path)
+        return parse_transcription(response_data)
+    finally:
+        await asyncio.to_thread(os.unlink, chunk_file_path)
+
+
+async def produce_chunks(
+    audio_file_path: str,
+    split_points: List[float],
+    output_pattern: str,
+    transcode: bool,
+    queue: "asyncio.Queue[Optional[Tuple[int, str]]]",
+    num_workers: int,
+) -> None:
     """
-    Main logic for transcribing the provided audio file:
-      1. Load environment vars & create OpenAI client
-      2. Read audio & split into chunks
-      3. Process each chunk concurrently
-      4. Save combined transcription and segments to disk
+    Splits the audio at the given split points and queues
+    (chunk_index, chunk_file_path) pairs as soon as each chunk is written,
+    then queues one None sentinel per worker.
+    """
+    chunk_index = 0
+    chunk_paths = segment_audio(audio_file_path, split_points, output_pattern, transcode)
+    try:
+        async for chunk_file_path in chunk_paths:
+            chunk_index += 1
+            await queue.put((chunk_index, chunk_file_path))
+    finally:
+        # Close the generator here, so ffmpeg is stopped and reaped before this
+        # task finishes, even when it is cancelled
+        await chunk_paths.aclose()
+
+    for _ in range(num_workers):
+        await queue.put(None)
+
+
+async def transcription_worker(
+    client: AsyncOpenAI,
+    queue: "asyncio.Queue[Optional[Tuple[int, str]]]",
+    results: "asyncio.Queue[Optional[Tuple[int, Transcription]]]",
+    chunk_format: str,
+    language: str,
+    limiter: AsyncLimiter,
+) -> None:
     """
-    await load_environment_variables()
-    client = await get_openai_client()
+    Transcribes queued chunks until it receives the None sentinel,
+    passing each result on together with its chunk index.
+    """
+    while True:
+        item = await queue.get()
+        if item is None:
+            return
+        chunk_index, chunk_file_path = item
+        transcription = await process_chunk(
+            client, chunk_file_path, chunk_format, chunk_index, language, limiter
+        )
+        await results.put((chunk_index, transcription))
 
-    if not os.path.exists(audio_file_path):
-        raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
 
-    audio_name, extension = os.path.splitext(audio_file_path)
-    audio_format = extension.lstrip(".").lower()
+def get_partial_path(file_path: str) -> str:
+    """
+    Returns the path used for an output file while it is still being written,
+    e.g. audio_transcription.txt -> audio_transcription.partial.txt.
+    """
+    root, extension = os.path.splitext(file_path)
+    return f"{root}.partial{extension}"
 
-    audio = await read_audio_file(audio_file_path)
-    print(f"Full audio duration: {audio.duration_seconds} seconds")
 
-    chunks = split_audio_into_chunks(audio)
+async def write_transcriptions(
+    results: "asyncio.Queue[Optional[Tuple[int, Transcription]]]",
+    transcription_file_path: str,
+    segments_file_path: str,
+    chunk_starts: List[float],
+) -> Tuple[bool, bool]:
+    """
+    Appends each chunk's text and segments to the output files as soon as
+    all earlier chunks have been written, holding back chunks that finish
+    out of order, and reports progress. Segment timestamps are shifted by
+    their chunk's start time in chunk_starts. Stops at the None sentinel.
+    Returns whether any text and any segments were written.
+    """
+    total_chunks = len(chunk_starts)
+    pending: Dict[int, Transcription] = {}
+    next_to_write = 1
+    has_text = has_segments = False
+
+    while True:
+        item = await results.get()
+        if item is None:
+            return has_text, has_segments
+        chunk_index, transcription = item
+        pending[chunk_index] = transcription
+
+        while next_to_write in pending:
+            transcription = pending.pop(next_to_write)
+            offset = chunk_starts[next_to_write - 1]
+            next_to_write += 1
+            writes = []
+
+            text = transcription.text.strip()
+            if text:
+                lines = [" ", text] if has_text else [text]
+                writes.append(save_file(lines, transcription_file_path, "a" if has_text else "w"))
+                has_text = True
+
+            segments = transcription.segments
+            if segments:
+                formatted_segments = (format_segment_text(s, offset) for s in segments)
+                writes.append(
+                    save_file(formatted_segments, segments_file_path, "a" if has_segments else "w")
+                )
+                has_segments = True
+
+            await asyncio.gather(*writes)
+            print(f"Saved chunk {next_to_write - 1}/{total_chunks}")
 
-    transcripts: List[str] = []
-    segments: List[TranscriptionSegment] = []
 
-    # Process all chunks concurrently
-    tasks = [
-        asyncio.create_task(
-            process_chunk(client, chunk, audio_format, i + 1, audio_name, language)
+async def run_transcription(audio_file_path: str, language: str) -> None:
+    """
+    Main logic for transcribing the provided audio file:
+      1. Create OpenAI client
+      2. Analyze the audio & split it into chunks with ffmpeg
+      3. Transcribe chunks concurrently as they are produced
+      4. Write transcription and segments to disk in chunk order
+    """
+    if MAX_CONCURRENT_TRANSCRIPTIONS < 1:
+        raise ValueError(
+            f"WHISPER_CONCURRENCY must be at least 1, got {MAX_CONCURRENT_TRANSCRIPTIONS}."
         )
-        for i, chunk in enumerate(chunks)
-    ]
-    transcriptions_data = await asyncio.gather(*tasks)
-
-    # Combine text and segments
-    for transcription in transcriptions_data:
-        transcripts.append(transcription.text)
-        segments.extend(transcription.segments)
+    if REQUESTS_PER_MINUTE < 1:
+        raise ValueError(f"WHISPER_RPM must be at least 1, got {REQUESTS_PER_MINUTE}.")
+
+    client = get_openai_client()
+    chunk_dir = tempfile.mkdtemp(prefix="whisper-chunks-")
+    try:
+        await asyncio.to_thread(os.makedirs, CACHE_DIR, exist_ok=True)
+    except OSError as error:
+        print(f"Could not create cache directory {CACHE_DIR}, continuing without it: {error}")
+
+    try:
+        if not os.path.exists(audio_file_path):
+            raise FileNotFoundError(f"Audio file not found: {audio_file_path}")
+
+        audio_name, extension = os.path.splitext(audio_file_path)
+        audio_format = extension.lstrip(".").lower()
+
+        # Find silences to split at, and whether the source needs converting
+        duration, bitrate_kbps, silences = await analyze_audio(audio_file_path)
+        split_points = choose_split_points(
+            duration, silences, CHUNK_DURATION_S, SILENCE_SEARCH_WINDOW_S
+        )
+        print(f"Full audio duration: {duration} seconds, splitting into {len(split_points) + 1} chunks")
 
-    combined_text = " ".join(transcripts).strip()
+        transcode = audio_format not in STREAM_COPY_FORMATS or (
+            bitrate_kbps is not None and bitrate_kbps > TRANSCODE_BITRATE_KBPS
+        )
+        chunk_format = TRANSCODE_FORMAT if transcode else audio_format
 
-    # Save final transcription
-    transcription_file_path = f"{audio_name}_transcription.txt"
-    if combined_text:
-        await save_file(combined_text, transcription_file_path)
-    else:
-        print("No transcription data found.")
+        # Transcribe chunks while ffmpeg is still producing the next ones;
+        # the worker count bounds how many API calls are in flight and
+        # results are written to disk in order as soon as they arrive
+        queue: "asyncio.Queue[Optional[Tuple[int, str]]]" = asyncio.Queue(
+            maxsize=CHUNK_QUEUE_SIZE
+        )
+        results: "asyncio.Queue[Optional[Tuple[int, Transcription]]]" = (
+            asyncio.Queue()
+        )
+        # A bucket of size 1 refilled every 60 / RPM seconds paces requests
+        # evenly, where AsyncLimiter(RPM, 60) would let RPM through at once
+        limiter = AsyncLimiter(1, 60 / REQUESTS_PER_MINUTE)
+        transcription_file_path = f"{audio_name}_transcription.txt"
+        segments_file_path = f"{audio_name}_segments.txt"
+
+        # Results go to .partial files, so finished chunks are readable while
+        # the run is in progress and kept if it is interrupted
+        writer = asyncio.create_task(
+            write_transcriptions(
+                results,
+                get_partial_path(transcription_file_path),
+                get_partial_path(segments_file_path),
+                [0.0, *split_points],
+            )
+        )
+        tasks = [
+            asyncio.create_task(
+                produce_chunks(
+                    audio_file_path,
+                    split_points,
+                    os.path.join(chunk_dir, f"chunk_%d.{chunk_format}"),
+                    transcode,
+                    queue,
+                    MAX_CONCURRENT_TRANSCRIPTIONS,
+                )
+            )
+        ]
+        tasks.extend(
+            asyncio.create_task(
+                transcription_worker(
+                    client, queue, results, chunk_format, language, limiter
+                )
+            )
+            for _ in range(MAX_CONCURRENT_TRANSCRIPTIONS)
+        )
+        try:
+            await asyncio.gather(*tasks)
+            await results.put(None)
+            has_text, has_segments = await writer
+        except BaseException:
+            for task in [*tasks, writer]:
+                task.cancel()
+            await asyncio.gather(*tasks, writer, return_exceptions=True)
+            raise
+
+        if has_text:
+            await asyncio.to_thread(
+                os.replace, get_partial_path(transcription_file_path), transcription_file_path
+            )
+        else:
+            print("No transcription data found.")
 
-    # Save segment timestamps
-    segments_file_path = f"{audio_name}_segments.txt"
-    if segments:
-        formatted_segments = "".join(format_segment_text(s) for s in segments if s)
-        await save_file(formatted_segments, segments_file_path)
-    else:
-        print("No segments data found.")
+        if has_segments:
+            await asyncio.to_thread(
+                os.replace, get_partial_path(segments_file_path), segments_file_path
+            )
+        else:
+            print("No segments data found.")
+    finally:
+        await client.close()
+        await asyncio.to_thread(shutil.rmtree, chunk_dir, ignore_errors=True)
 
     print("Transcription complete.")
 
@@ -207,7 +759,16 @@ def main() -> None:
     """
     Entry point for command-line usage.
     """
+    load_dotenv()
     audio_file_path, language_code = parse_arguments()
+
+    # uvloop is an optional, faster event loop (not available on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     print(f"Transcribing file '{audio_file_path}' using language '{language_code}'")
     asyncio.run(run_transcription(audio_file_path, language_code))
 